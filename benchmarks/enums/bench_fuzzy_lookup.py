@@ -0,0 +1,92 @@
+import os
+import sys
+import timeit
+
+# Ensure the local `src` is correctly importable
+sys.path.insert(0, os.path.abspath("src"))
+
+from gunz_utils.enums import BaseStrEnum
+
+
+class Color(BaseStrEnum):
+    __ALIASES__ = {"dark": "dark_blue"}
+    RED = "red"
+    BLUE = "blue"
+    DARK_BLUE = "dark_blue"
+    LIGHT_GREEN = "light green"
+
+
+# Large table-style enum (ISO/error-code style) sharing long prefixes.
+IsoCode = BaseStrEnum(
+    "IsoCode", {f"CODE_{i:03d}": f"iso-code-{i:03d}" for i in range(200)}
+)
+
+
+# Inputs exercising each lookup path: exact value, name, alias and
+# separator-normalized spellings.
+INPUTS = ["red", "BLUE", "dark", "DARK_BLUE", "light-green", "Light Green"]
+
+# Separator normalization candidates; chained `str.replace` is kept in
+# `enums.py` because it beats `str.translate` on short strings.
+_SEPARATOR_TABLE = str.maketrans("- ", "__")
+
+
+def normalize_replace(s):
+    return s.replace("-", "_").replace(" ", "_")
+
+
+def normalize_translate(s):
+    return s.translate(_SEPARATOR_TABLE)
+
+
+# Alias/lookup key interning candidate; `enums.py` keeps plain keys because
+# interning the query costs an extra probe of the interpreter's intern table.
+_PLAIN_MAP = dict(IsoCode._lookup_map)
+_INTERNED_MAP = {sys.intern(k): v for k, v in IsoCode._lookup_map.items()}
+
+
+def lookup_plain(s):
+    return _PLAIN_MAP.get(s.lower())
+
+
+def lookup_interned(s):
+    return _INTERNED_MAP.get(sys.intern(s.lower()))
+
+
+def benchmark():
+    def run_lookup():
+        for value in INPUTS:
+            Color.from_fuzzy_string(value)
+
+    time_taken = timeit.timeit(run_lookup, number=100000)
+    print(
+        f"Time taken for {len(INPUTS)} fuzzy lookups 100000 times: "
+        f"{time_taken:.4f} seconds"
+    )
+
+    def run_large_lookup():
+        IsoCode.from_fuzzy_string("ISO CODE 150")
+        IsoCode.get_or_none("iso-code-999")
+        IsoCode.get_or_none("zzz")
+
+    time_taken = timeit.timeit(run_large_lookup, number=100000)
+    print(
+        f"Time taken for 3 lookups (1 hit, 2 misses) on a {len(IsoCode)}-member "
+        f"enum 100000 times: {time_taken:.4f} seconds"
+    )
+
+    for func in (lookup_plain, lookup_interned):
+        time_taken = timeit.timeit(
+            lambda func=func: func("ISO-CODE-150"), number=1000000
+        )
+        print(f"{func.__name__}: {time_taken:.4f} seconds per 1000000 calls")
+
+    for func in (normalize_replace, normalize_translate):
+        time_taken = timeit.timeit(
+            lambda func=func: func("light green-blue"), number=1000000
+        )
+        print(f"{func.__name__}: {time_taken:.4f} seconds per 1000000 calls")
+
+
+if __name__ == "__main__":
+    benchmark()
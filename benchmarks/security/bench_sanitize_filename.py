@@ -14,6 +14,11 @@ random.seed(42)
 def generate_random_filename(length=10):
     return ''.join(random.choices(string.ascii_letters + string.digits, k=length)) + ".txt"
 
+def generate_dirty_filename(length=10):
+    # Upload-style names: spaces, shell metacharacters and existing underscores
+    alphabet = string.ascii_letters + string.digits + "  _?*<>|:"
+    return "".join(random.choices(alphabet, k=length)) + ".txt"
+
 def benchmark():
     # Mix of mostly normal filenames and a few reserved
     filenames = [generate_random_filename(random.randint(5, 20)) for _ in range(1000)]
@@ -29,5 +34,19 @@ def benchmark():
     time_taken = timeit.timeit(run_benchmark, number=1000)
     print(f"Time taken to sanitize {len(filenames)} normal files 1000 times: {time_taken:.4f} seconds")
 
+    dirty_filenames = [
+        generate_dirty_filename(random.randint(5, 20)) for _ in range(1000)
+    ]
+
+    def run_dirty_benchmark():
+        for f in dirty_filenames:
+            sanitize_filename(f)
+
+    time_taken = timeit.timeit(run_dirty_benchmark, number=1000)
+    print(
+        f"Time taken to sanitize {len(dirty_filenames)} dirty files 1000 times: "
+        f"{time_taken:.4f} seconds"
+    )
+
 if __name__ == "__main__":
     benchmark()
@@ -17,6 +17,9 @@ __license__ = "Clear BSD"
 # STANDARD LIBRARY IMPORTS
 # =============================================================================
 import enum
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any, ClassVar, Self, TypeVar
 
 # =============================================================================
@@ -36,6 +39,75 @@ DEFAULT_MAX_INPUT_LENGTH = 1024  # Security: Prevent DoS via long strings
 # ? reference `cls.DEFAULT_MAX_INPUT_LENGTH` (the class attribute).
 _MAX_INPUT_LENGTH = DEFAULT_MAX_INPUT_LENGTH
 
+# ? Upper bound on memoized fuzzy resolutions per enum class, so
+# ? attacker-controlled spellings cannot grow memory without limit.
+_FUZZY_CACHE_SIZE = 256
+
+
+# =============================================================================
+# EXCEPTIONS
+# =============================================================================
+class FuzzyLookupError(ValueError):
+    """
+    Raised when a fuzzy enum lookup finds no matching member.
+
+    The message lists every valid value, so it is only built on first
+    `str()`; callers such as `get_or_none` that catch and discard the error
+    never pay for it.
+    """
+
+    # ? Slots keep BaseException from allocating an instance __dict__ per raise
+    __slots__ = ("enum_cls", "value_str")
+
+    def __init__(self, enum_cls: type[enum.Enum], value_str: str) -> None:
+        super().__init__(enum_cls, value_str)
+        self.enum_cls = enum_cls
+        self.value_str = value_str
+
+    def __str__(self) -> str:
+        valid_options = ", ".join(f"'{value}'" for value in self.enum_cls._values)
+        return (
+            f"'{self.value_str}' is not a valid {self.enum_cls.__name__}. "
+            f"Please use one of: {valid_options}"
+        )
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+def _normalize_separators(value_lower: str) -> str:
+    """
+    Maps '-' and ' ' to '_' in an already-lowercased string.
+
+    Returns `value_lower` itself when it has no separator, so callers can
+    detect "nothing changed" with an identity check.
+    """
+    # ? Only pay for the two replace() copies when a separator is actually
+    # ? present; `in` is a C-level scan.
+    if "-" in value_lower or " " in value_lower:
+        return value_lower.replace("-", "_").replace(" ", "_")
+    return value_lower
+
+
+def _build_alias_member_map(cls: type[enum.Enum]) -> dict[str, Any]:
+    """
+    Builds the mapping from lowercase alias to enum member for `cls`.
+
+    Alias keys are lowercased so `{"Dark": ...}` matches like `{"dark": ...}`.
+    An alias pointing at a value that is not a member fails at class
+    definition time instead of on first lookup.
+    """
+    alias_map = {}
+    for alias, target in cls.__ALIASES__.items():
+        member = cls._value2member_map_.get(target)
+        if member is None:
+            raise ValueError(
+                f"Alias target '{target}' is not a valid "
+                f"member value for {cls.__name__}"
+            )
+        alias_map.setdefault(alias.lower(), member)
+    return alias_map
+
 
 # =============================================================================
 # BASE ENUM IMPLEMENTATION
@@ -71,42 +143,60 @@ class BaseStrEnum(enum.StrEnum):
     # ? Using dunder name to avoid it being treated as an Enum member
     __ALIASES__: ClassVar[dict[str, str]] = {}
 
-    # Lazily initialized map for fuzzy lookups
-    _fuzzy_lookup_map: ClassVar[dict[str, Any]]
+    # Unified alias/name/value -> member map, built once per subclass in
+    # `__init_subclass__`
+    _lookup_map: ClassVar[Mapping[str, Any]]
+
+    # Introspection results, cached once per subclass in `__init_subclass__`
+    _names: ClassVar[tuple[str, ...]]
+    _values: ClassVar[tuple[str, ...]]
+    _items: ClassVar[tuple[tuple[str, str], ...]]
+
+    # Bounded memo of `_from_fuzzy_uncached`, one per subclass
+    _cached_from_fuzzy: ClassVar[Any]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # ? Members already exist at this point, so the lookup map and the
+        # ? introspection tuples can be built eagerly and stored as
+        # ? read-only class attributes.
+        cls._lookup_map = MappingProxyType(cls._build_lookup_map())
+        cls._items = tuple((member.name, member.value) for member in cls)
+        cls._names = tuple(name for name, _ in cls._items)
+        cls._values = tuple(value for _, value in cls._items)
+        # ? Lookups are pure once the map exists; only successful resolutions
+        # ? are cached (lru_cache does not store raised exceptions).
+        cls._cached_from_fuzzy = functools.lru_cache(maxsize=_FUZZY_CACHE_SIZE)(
+            cls._from_fuzzy_uncached
+        )
 
     @classmethod
-    def _get_fuzzy_map(cls) -> dict[str, Self]:
+    def _build_lookup_map(cls) -> dict[str, Self]:
         """
-        Lazily builds and returns a mapping for fuzzy lookups.
-        Key is the normalized string or lowercase name.
-        Value is the enum member.
+        Builds the unified mapping for fuzzy lookups.
+        Key is a lowercase alias, the normalized or lowercase value, or the
+        lowercase name. Value is the enum member.
         """
-        # Use a private attribute on the class itself to store the map
-        # We use getattr/setattr to avoid static type checker issues with
-        # dynamically added attributes on Enum classes.
-        try:
-            return cls._fuzzy_lookup_map
-        except AttributeError:
-            lookup_map = {}
-            for member in cls:
-                # Add normalized value
-                val_lower = member.value.lower()
-                val_norm = val_lower.replace("-", "_").replace(" ", "_")
-                if val_norm not in lookup_map:
-                    lookup_map[val_norm] = member
-
-                # Add raw lowercase value
-                # (optimization for inputs matching value but with separators)
-                if val_lower not in lookup_map:
-                    lookup_map[val_lower] = member
-
-                # Add lowercase name
-                name_lower = member.name.lower()
-                if name_lower not in lookup_map:
-                    lookup_map[name_lower] = member
-
-            cls._fuzzy_lookup_map = lookup_map
-            return lookup_map
+        # ? Aliases go in first so they keep precedence over names/values
+        lookup_map = _build_alias_member_map(cls)
+        for member in cls:
+            # Add normalized value
+            val_lower = member.value.lower()
+            val_norm = _normalize_separators(val_lower)
+            if val_norm not in lookup_map:
+                lookup_map[val_norm] = member
+
+            # Add raw lowercase value
+            # (optimization for inputs matching value but with separators)
+            if val_lower not in lookup_map:
+                lookup_map[val_lower] = member
+
+            # Add lowercase name
+            name_lower = member.name.lower()
+            if name_lower not in lookup_map:
+                lookup_map[name_lower] = member
+
+        return lookup_map
 
     @classmethod
     def from_fuzzy_string(cls, value_str: str) -> Self:
@@ -120,61 +210,46 @@ class BaseStrEnum(enum.StrEnum):
         if len(value_str) > max_len:
             raise ValueError(f"Input string too long (max {max_len} chars)")
 
+        return cls._cached_from_fuzzy(value_str)
+
+    @classmethod
+    def _from_fuzzy_uncached(cls, value_str: str) -> Self:
+        """Resolves `value_str` without the length guard or memoization."""
         value_lower = value_str.lower()
-        _aliases = cls.__ALIASES__
+        lookup_map = cls._lookup_map
 
-        # 1. Check for defined aliases (string -> target_string_value)
-        if value_lower in _aliases:
-            alias_target_value = _aliases[value_lower]
+        # 1. Single probe covers aliases, lowercase names and values
+        # ? This catches the common case without any normalization
+        member = lookup_map.get(value_lower)
+        if member is not None:
+            return member
 
-            # Check internal map first
-            if alias_target_value in cls._value2member_map_:
-                return cls._value2member_map_[alias_target_value]
+        # 2. Normalize separators for fuzzy matching and retry
+        # ? Without a separator the same string comes back, which already
+        # ? missed above, so the second probe is skipped.
+        normalized_value_input = _normalize_separators(value_lower)
+        if normalized_value_input is not value_lower:
+            member = lookup_map.get(normalized_value_input)
+            if member is not None:
+                return member
 
-            # Fallback to instantiation (should work if valid member)
-            try:
-                return cls(alias_target_value)
-            except ValueError as exc:
-                raise ValueError(
-                    f"Alias target '{alias_target_value}' is not a valid "
-                    f"member value for {cls.__name__}"
-                ) from exc
-
-        # 2. Check for matches in the fuzzy map
-        # Optimization: Use cached lookup map instead of iterating
-        fuzzy_map = cls._get_fuzzy_map()
-
-        # Check raw lowercase input first (avoids normalization if unnecessary)
-        # This catches direct name matches or values that are already normalized
-        if value_lower in fuzzy_map:
-            return fuzzy_map[value_lower]
-
-        # 3. Normalize separators and case for fuzzy matching
-        normalized_value_input = value_lower.replace("-", "_").replace(" ", "_")
-
-        if normalized_value_input in fuzzy_map:
-            return fuzzy_map[normalized_value_input]
-
-        valid_options = ", ".join(f"'{m.value}'" for m in cls)
-        raise ValueError(
-            f"'{value_str}' is not a valid {cls.__name__}. "
-            f"Please use one of: {valid_options}"
-        )
+        raise FuzzyLookupError(cls, value_str)
 
     @classmethod
     def names(cls) -> list[str]:
         """Returns a list of all member names."""
-        return [member.name for member in cls]
+        # ? Fresh list from the cached tuple so callers may mutate it freely.
+        return list(cls._names)
 
     @classmethod
     def values(cls) -> list[str]:
         """Returns a list of all member values."""
-        return [member.value for member in cls]
+        return list(cls._values)
 
     @classmethod
     def items(cls) -> list[tuple[str, str]]:
         """Returns a list of (name, value) tuples."""
-        return [(member.name, member.value) for member in cls]
+        return list(cls._items)
 
     @classmethod
     def get_or_none(cls, value: object) -> Self | None:
@@ -184,6 +259,11 @@ class BaseStrEnum(enum.StrEnum):
         if isinstance(value, cls):
             return value
 
+        # ? Reject oversized strings before cls(value), whose failure message
+        # ? would repr() the whole input; only an exact value match survives.
+        if isinstance(value, str) and len(value) > cls.DEFAULT_MAX_INPUT_LENGTH:
+            return cls._value2member_map_.get(value)
+
         try:
             return cls(value)
         except (ValueError, TypeError):
@@ -199,7 +279,7 @@ class BaseStrEnum(enum.StrEnum):
 
     @classmethod
     def choices(cls) -> list[str]:
-        return cls.values()
+        return list(cls._values)
 
 
 # ? Default security limit on input string length. Subclasses may override
@@ -215,6 +295,12 @@ class BaseStrEnum(enum.StrEnum):
 # ? on slow hardware (regex backtracking is O(n) on `val_norm.replace`).
 BaseStrEnum.DEFAULT_MAX_INPUT_LENGTH = 1024
 
+# ? The base class itself has no members; subclasses get their own map from
+# ? `__init_subclass__`.
+BaseStrEnum._lookup_map = MappingProxyType({})
+BaseStrEnum._names = BaseStrEnum._values = BaseStrEnum._items = ()
+BaseStrEnum._cached_from_fuzzy = BaseStrEnum._from_fuzzy_uncached
+
 
 @enum.verify(enum.UNIQUE)
 class OptionalBaseStrEnum(BaseStrEnum):
@@ -238,6 +324,9 @@ class OptionalBaseStrEnum(BaseStrEnum):
             return cls.NONE
 
         # Try fuzzy match via helper, but do NOT retry cls(value) to avoid recursion
+        # ? from_fuzzy_string is memoized per class, so repeated implicit
+        # ? construction with the same spelling (e.g. Status("Active")) is a
+        # ? single cache hit.
         if isinstance(value, str):
             try:
                 return cls.from_fuzzy_string(value)
@@ -264,24 +353,40 @@ class BaseIntEnum(enum.IntEnum):
 
     __ALIASES__: ClassVar[dict[str, int]] = {}
 
-    # Lazily initialized map for name lookups
-    _name_lookup_map: ClassVar[dict[str, Any]]
+    # Unified alias/name -> member map, built once per subclass in
+    # `__init_subclass__`
+    _lookup_map: ClassVar[Mapping[str, Any]]
+
+    # Introspection results, cached once per subclass in `__init_subclass__`
+    _names: ClassVar[tuple[str, ...]]
+    _values: ClassVar[tuple[int, ...]]
+    _items: ClassVar[tuple[tuple[str, int], ...]]
+
+    # Bounded memo of `_from_fuzzy_int_uncached`, one per subclass
+    _cached_from_fuzzy_int: ClassVar[Any]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._lookup_map = MappingProxyType(cls._build_lookup_map())
+        cls._items = tuple((member.name, member.value) for member in cls)
+        cls._names = tuple(name for name, _ in cls._items)
+        cls._values = tuple(value for _, value in cls._items)
+        cls._cached_from_fuzzy_int = functools.lru_cache(maxsize=_FUZZY_CACHE_SIZE)(
+            cls._from_fuzzy_int_uncached
+        )
 
     @classmethod
-    def _get_name_lookup_map(cls) -> dict[str, Self]:
+    def _build_lookup_map(cls) -> dict[str, Self]:
         """
-        Lazily builds and returns a mapping from lowercase name to enum member.
+        Builds the mapping from lowercase alias or name to enum member.
         """
-        try:
-            return cls._name_lookup_map
-        except AttributeError:
-            lookup_map = {}
-            for member in cls:
-                name_lower = member.name.lower()
-                if name_lower not in lookup_map:
-                    lookup_map[name_lower] = member
-            cls._name_lookup_map = lookup_map
-            return lookup_map
+        # ? Aliases go in first so they keep precedence over names
+        lookup_map = _build_alias_member_map(cls)
+        for member in cls:
+            name_lower = member.name.lower()
+            if name_lower not in lookup_map:
+                lookup_map[name_lower] = member
+        return lookup_map
 
     @classmethod
     def from_fuzzy_int_string(cls, value_str: str) -> Self:
@@ -295,31 +400,19 @@ class BaseIntEnum(enum.IntEnum):
         if len(value_str) > max_len:
             raise ValueError(f"Input string too long (max {max_len} chars)")
 
-        value_lower = value_str.lower()
-        _aliases = cls.__ALIASES__
+        return cls._cached_from_fuzzy_int(value_str)
 
-        # 1. Check for aliases (string -> int_value)
-        if value_lower in _aliases:
-            int_target_value = _aliases[value_lower]
+    @classmethod
+    def _from_fuzzy_int_uncached(cls, value_str: str) -> Self:
+        """Resolves `value_str` without the length guard or memoization."""
+        value_lower = value_str.lower()
 
-            if int_target_value in cls._value2member_map_:
-                return cls._value2member_map_[int_target_value]
+        # 1. Single probe covers aliases and case-insensitive member names
+        member = cls._lookup_map.get(value_lower)
+        if member is not None:
+            return member
 
-            try:
-                return cls(int_target_value)
-            except ValueError as exc:
-                raise ValueError(
-                    f"Alias target '{int_target_value}' is not a valid "
-                    f"member value for {cls.__name__}"
-                ) from exc
-
-        # 2. Check for member name matches (case-insensitive)
-        # Optimization: Use cached lookup map instead of iterating
-        name_map = cls._get_name_lookup_map()
-        if value_lower in name_map:
-            return name_map[value_lower]
-
-        # 3. Try to convert to int if it's a string representation of a number
+        # 2. Try to convert to int if it's a string representation of a number
         try:
             int_value = int(value_str)
             if int_value in cls._value2member_map_:
@@ -330,23 +423,19 @@ class BaseIntEnum(enum.IntEnum):
             #? reported uniformly with the valid integer choices below.
             pass
 
-        valid_options = ", ".join(f"'{m.value}'" for m in cls)
-        raise ValueError(
-            f"'{value_str}' is not a valid {cls.__name__}. "
-            f"Please use one of: {valid_options}"
-        )
+        raise FuzzyLookupError(cls, value_str)
 
     @classmethod
     def names(cls) -> list[str]:
-        return [member.name for member in cls]
+        return list(cls._names)
 
     @classmethod
     def values(cls) -> list[int]:
-        return [member.value for member in cls]
+        return list(cls._values)
 
     @classmethod
     def items(cls) -> list[tuple[str, int]]:
-        return [(member.name, member.value) for member in cls]
+        return list(cls._items)
 
     @classmethod
     def get_or_none(cls, value: object) -> Self | None:
@@ -356,6 +445,11 @@ class BaseIntEnum(enum.IntEnum):
         if value is None:
             return None
 
+        # ? Integer members never match a string exactly, so oversized
+        # ? strings can be rejected before any conversion work.
+        if isinstance(value, str) and len(value) > cls.DEFAULT_MAX_INPUT_LENGTH:
+            return None
+
         try:
             return cls(value)
         except (ValueError, TypeError):
@@ -371,7 +465,10 @@ class BaseIntEnum(enum.IntEnum):
 
     @classmethod
     def choices(cls) -> list[Any]:
-        return cls.values()
+        return list(cls._values)
 
 
 BaseIntEnum.DEFAULT_MAX_INPUT_LENGTH = 1024
+BaseIntEnum._lookup_map = MappingProxyType({})
+BaseIntEnum._names = BaseIntEnum._values = BaseIntEnum._items = ()
+BaseIntEnum._cached_from_fuzzy_int = BaseIntEnum._from_fuzzy_int_uncached
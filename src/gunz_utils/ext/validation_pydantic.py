@@ -16,26 +16,272 @@ __license__ = "Clear BSD"
 # STANDARD LIBRARY IMPORTS
 # =============================================================================
 import functools
+import inspect
+import threading
+import types
 import typing as t
 
 # =============================================================================
 # THIRD-PARTY IMPORTS
 # =============================================================================
-from pydantic import ValidationError, validate_call
+# ? `validate_call` is imported where the validator is first built; its
+# ? decorator module is only needed once a call misses the fast path. The
+# ? documented `from gunz_utils.ext.validation_pydantic import validate_call`
+# ? is served by the module `__getattr__` below.
+from pydantic import ValidationError
+from pydantic.fields import FieldInfo
 
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+# ? Annotations for which an exact type match means pydantic would pass the
+# ? argument through unchanged, so validation can be skipped entirely.
+_FAST_PATH_TYPES = frozenset({int, str, float, bytes, bool, type(None)})
+
+# ? Leading markers pydantic puts on validate_call error locations
+_ARGS_KWARGS = frozenset(("args", "kwargs"))
+
+# ? Parameter kinds the generated fast path can bind; *args/**kwargs go
+# ? through pydantic.
+_FAST_PATH_KINDS = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    inspect.Parameter.KEYWORD_ONLY,
+)
+
+# ? Marks an argument the caller did not pass in the generated fast path
+_MISSING = object()
+
+def _fast_path_types(
+    f: t.Callable,
+) -> list[tuple[inspect.Parameter, tuple[type, ...] | None]] | None:
+    """
+    Returns each parameter of `f` with the exact types it accepts, or None
+    if the signature is not eligible for the fast path.
+
+    An accepted-types entry of None means "unannotated" (pydantic treats it
+    as `Any`, so no check is needed). `Annotated[...]` hints and `Field(...)`
+    defaults carry constraints or validators, so they are never eligible.
+    """
+    try:
+        hints = t.get_type_hints(f, include_extras=True)
+        sig = inspect.signature(f)
+    except Exception:
+        return None
 
-def type_checked(func: t.Callable | None = None, **kwargs: t.Any) -> t.Callable:
+    accepted: list[tuple[inspect.Parameter, tuple[type, ...] | None]] = []
+    for name, param in sig.parameters.items():
+        if param.kind not in _FAST_PATH_KINDS:
+            return None
+        if isinstance(param.default, FieldInfo):
+            return None
+        if name not in hints:
+            accepted.append((param, None))
+            continue
+        ann = hints[name]
+        if t.get_origin(ann) in (t.Union, types.UnionType):
+            options = t.get_args(ann)
+        else:
+            options = (ann,)
+        # ? Checked before the set lookup: Annotated metadata may be unhashable
+        if any(t.get_origin(o) is t.Annotated for o in options):
+            return None
+        if not all(o in _FAST_PATH_TYPES for o in options):
+            return None
+        accepted.append((param, options))
+    return accepted
+
+
+def _build_fast_wrapper(f: t.Callable, slow: t.Callable) -> t.Callable | None:
+    """
+    Generates a wrapper that calls `f` directly when every argument already
+    has exactly one of the annotated builtin types, and defers to `slow`
+    (the pydantic path) for anything else.
+
+    Exact-arity positional calls are checked inline. Other calls are bound
+    by a generated `_bind` mirroring the signature of `f`; any call it
+    cannot bind (missing, unknown or duplicate arguments) goes to `slow` so
+    the error comes from pydantic.
+
+    Returns None when `f` has a signature the fast path cannot handle.
+    """
+    accepted = _fast_path_types(f)
+    if accepted is None:
+        return None
+
+    # ? Exact `type(x) is T` checks (not isinstance) so bool never passes as
+    # ? int and str subclasses still go through pydantic's coercion.
+    # ? Locals are named a0..aN; only `_bind` uses the real parameter names,
+    # ? and its body never refers to a global.
+    namespace: dict[str, t.Any] = {
+        "_f": f,
+        "_slow": slow,
+        "_M": _MISSING,
+        "_VE": ValidationError,
+        "_VTE": ValidationTypeError,
+    }
+    arg_names = [f"a{i}" for i in range(len(accepted))]
+    bind_params = []
+    call_args = []
+    checks = []
+    bound_checks = []
+    fill_defaults = []
+    seen_kw_only = False
+    for i, (param, options) in enumerate(accepted):
+        arg = arg_names[i]
+        if param.kind is inspect.Parameter.KEYWORD_ONLY:
+            if not seen_kw_only:
+                bind_params.append("*")
+                seen_kw_only = True
+            call_args.append(f"{param.name}={arg}")
+        else:
+            call_args.append(arg)
+        bind_params.append(f"{param.name}=_M")
+        if param.kind is inspect.Parameter.POSITIONAL_ONLY and (
+            i + 1 == len(accepted)
+            or accepted[i + 1][0].kind is not inspect.Parameter.POSITIONAL_ONLY
+        ):
+            bind_params.append("/")
+
+        if options is None:
+            check = None
+        else:
+            namespace[f"_t{i}"] = options[0] if len(options) == 1 else options
+            op = "is" if len(options) == 1 else "in"
+            check = f"type({arg}) {op} _t{i}"
+            checks.append(check)
+
+        # ? pydantic does not validate defaults, so an omitted argument is
+        # ? filled in unchecked; an omitted required one goes to pydantic.
+        if param.default is not inspect.Parameter.empty:
+            namespace[f"_d{i}"] = param.default
+            fill_defaults.append(f"if {arg} is _M: {arg} = _d{i}")
+            if check is not None:
+                bound_checks.append(f"({arg} is _M or {check})")
+        elif check is not None:
+            bound_checks.append(check)
+        else:
+            bound_checks.append(f"{arg} is not _M")
+
+    unpack = f"{', '.join(arg_names)}, = " if arg_names else ""
+    call = f"_f({', '.join(call_args)})"
+    # ? The body of `f` may raise a pydantic ValidationError of its own (e.g.
+    # ? building a model from its arguments); translate it as `wrapper` does
+    # ? so raw input values never escape.
+    guarded_call = [
+        "try:",
+        f"    return {call}",
+        "except _VE as e:",
+        "    raise _VTE(e, _f.__name__) from None",
+    ]
+    lines = [
+        f"def _bind({', '.join(bind_params)}):",
+        f"    return ({''.join(f'{param.name}, ' for param, _ in accepted)})",
+        "def wrapper(*args, **kw):",
+    ]
+    if not seen_kw_only:
+        lines.append(f"    if not kw and len(args) == {len(arg_names)}:")
+        if arg_names:
+            lines.append(f"        {unpack}args")
+        if checks:
+            lines.append(f"        if {' and '.join(checks)}:")
+            lines += [f"            {line}" for line in guarded_call]
+            lines.append("        return _slow(*args, **kw)")
+        else:
+            lines += [f"        {line}" for line in guarded_call]
+    lines += [
+        "    try:",
+        f"        {unpack}_bind(*args, **kw)",
+        "    except TypeError:",
+        "        return _slow(*args, **kw)",
+    ]
+    bound_call = [*fill_defaults, *guarded_call]
+    if bound_checks:
+        lines.append(f"    if {' and '.join(bound_checks)}:")
+        lines += [f"        {line}" for line in bound_call]
+        lines.append("    return _slow(*args, **kw)")
+    else:
+        lines += [f"    {line}" for line in bound_call]
+
+    exec("\n".join(lines), namespace)
+    return functools.update_wrapper(namespace["wrapper"], f)
+
+
+def _loc(loc: tuple[int | str, ...]) -> str:
+    """Renders an error location, dropping the leading 'args'/'kwargs' marker."""
+    # ? Location is usually ('args', 0) or ('kwargs', 'arg_name'); we want to
+    # ? present a clean name to the user. That shape gets a direct branch.
+    if loc and loc[0] in _ARGS_KWARGS:
+        if len(loc) == 2:
+            return str(loc[1])
+        loc = loc[1:]
+    return " -> ".join(map(str, loc)) if loc else "input"
+
+
+def _format_errors(exc: ValidationError, func_name: str) -> str:
+    """Renders a pydantic `ValidationError` as the `type_checked` message."""
+    # ? pydantic guarantees 'loc', 'msg' and 'input' in every error dict.
+    # ? SECURITY: Do not leak the actual input value in the error message as
+    # ? it might be sensitive (e.g., a password). Show only its type.
+    lines = (
+        f"Argument '{_loc(error['loc'])}': {error['msg']} "
+        f"(got type '{type(error['input']).__name__}')"
+        # ? Skip the per-error docs URL and ctx dict; neither is rendered.
+        for error in exc.errors(include_url=False, include_context=False)
+    )
+    header = f"Validation error in '{func_name}':\n"
+    return header + "\n".join(lines)
+
+
+class ValidationTypeError(TypeError):
+    """
+    TypeError raised by `type_checked` when argument validation fails.
+
+    The message is rendered from the pydantic error on first `str()`, so
+    callers that catch and discard the error never pay for formatting.
+    """
+
+    __slots__ = ("_validation_error", "_func_name", "_message")
+
+    def __init__(self, validation_error: ValidationError, func_name: str) -> None:
+        # ? Nothing goes into `args`: the pydantic error's repr contains the
+        # ? raw input values, which must not leak through repr(exc).
+        super().__init__()
+        self._validation_error = validation_error
+        self._func_name = func_name
+        self._message: str | None = None
+
+    def __str__(self) -> str:
+        if self._message is None:
+            self._message = _format_errors(self._validation_error, self._func_name)
+        return self._message
+
+    def __repr__(self) -> str:
+        # ? Rendered from the safe message, never from `_validation_error`
+        return f"{type(self).__name__}({str(self)!r})"
+
+    def __reduce__(self) -> tuple[type, tuple[str]]:
+        # ? Pickle as a plain TypeError carrying only the rendered message
+        return TypeError, (str(self),)
+
+
+def type_checked(
+    func: t.Callable | None = None,
+    /,
+    **kwargs: t.Any,
+) -> t.Callable:
     """
     A wrapper around pydantic.validate_call that provides cleaner,
     user-friendly error messages.
 
-    It catches `pydantic.ValidationError` and re-raises it as a `TypeError` with a
-    formatted message indicating exactly which argument failed and why.
+    It catches `pydantic.ValidationError` and re-raises it as a
+    `ValidationTypeError` (a `TypeError` subclass) with a formatted message
+    indicating exactly which argument failed and why.
 
     Parameters
     ----------
     func : Callable | None
-        The function to decorate.
+        The function to decorate (positional-only).
     **kwargs : Any
         Additional arguments passed to `pydantic.validate_call` (e.g., `config`).
 
@@ -57,50 +303,57 @@ def type_checked(func: t.Callable | None = None, **kwargs: t.Any) -> t.Callable:
     """
 
     def decorator(f: t.Callable) -> t.Callable:
-        # ? Create the validated version of the function using pydantic
-        validated_func = validate_call(f, **kwargs)
+        # ? The pydantic-validated version of the function is built on first
+        # ? call, so decorating functions that are never called (or only hit
+        # ? the fast path) does not pay for schema construction at import.
+        # ? The lock is only taken until the validator exists; the unlocked
+        # ? re-check makes every later call a single local read.
+        validated_func: t.Callable | None = None
+        init_lock = threading.Lock()
 
-        @functools.wraps(f)
         def wrapper(*args: t.Any, **kw: t.Any) -> t.Any:
+            nonlocal validated_func
+            if validated_func is None:
+                with init_lock:
+                    if validated_func is None:
+                        from pydantic import validate_call
+
+                        validated_func = validate_call(f, **kwargs)
             try:
                 return validated_func(*args, **kw)
             except ValidationError as e:
-                errors = []
-                for error in e.errors():
-                    # ? Extract location: usually ('args', 0) or ('kwargs', 'arg_name')
-                    # ? We want to present a clean name to the user.
-                    loc = error.get("loc", ())
-                    msg = error.get("msg", "Invalid input")
-                    input_val = error.get("input", "unknown")
-
-                    # ? Simplify location string
-                    # ? Remove 'args' or 'kwargs' if they are the first element
-                    clean_loc = []
-                    for item in loc:
-                        if item not in ("args", "kwargs"):
-                            clean_loc.append(str(item))
-
-                    loc_str = " -> ".join(clean_loc) if clean_loc else "input"
-
-                    # ? SECURITY: Do not leak the actual input value in the
-                    # ? error message as it might be sensitive (e.g., a password).
-                    # ? Instead, show the type of the input.
-                    input_type = type(input_val).__name__
-                    errors.append(
-                        f"Argument '{loc_str}': {msg} (got type '{input_type}')"
-                    )
-
-                error_msg = f"Validation error in '{f.__name__}':\n" + "\n".join(errors)
-
                 # ? Re-raise as TypeError to be more Pythonic for type issues,
                 # ? effectively hiding the Pydantic trace from end users unless
                 # ? they look closer.
                 #? Suppress Pydantic's implementation traceback because callers
                 #? need a concise public type error, not validator internals.
-                raise TypeError(error_msg) from None
+                raise ValidationTypeError(e, f.__name__) from None
+
+        functools.update_wrapper(wrapper, f)
+
+        # ? Simple scalar signatures get a generated isinstance-style fast
+        # ? path; pydantic config kwargs may change coercion, so only the
+        # ? bare decorator qualifies.
+        if not kwargs:
+            fast_wrapper = _build_fast_wrapper(f, wrapper)
+            if fast_wrapper is not None:
+                return fast_wrapper
 
         return wrapper
 
-    if func:
-        return decorator(func)
-    return decorator
+    # ? Compare against None rather than relying on truthiness; `func` is
+    # ? positional-only so it can never swallow a validate_call keyword.
+    return decorator if func is None else decorator(func)
+
+
+def __getattr__(name: str) -> t.Any:
+    """PEP 562 lazy module attribute resolution.
+
+    Re-exports `pydantic.validate_call` on first access without importing
+    its decorator module when this module is loaded.
+    """
+    if name == "validate_call":
+        from pydantic import validate_call
+
+        return validate_call
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -60,6 +60,7 @@ def _safe_args_repr(exc: Exception) -> str:
 
 def type_checked(
     func: t.Callable | None = None,
+    /,
     **kwargs: t.Any,
 ) -> t.Callable:
     def decorator(f: t.Callable) -> t.Callable:
@@ -23,6 +23,19 @@ import re
 _INVALID_CHARS_PATTERN = re.compile(r"[^\w\.\-]+")
 _MAX_FILENAME_INPUT_LENGTH = 4096  # Security: limit input size to prevent DoS
 
+# Windows reserved device names (compared against the upper-cased root).
+# All of them are exactly 3 or 4 characters long.
+_WINDOWS_RESERVED_NAMES = frozenset(
+    {
+        "CON",
+        "PRN",
+        "AUX",
+        "NUL",
+        *(f"COM{i}" for i in range(1, 10)),
+        *(f"LPT{i}" for i in range(1, 10)),
+    }
+)
+
 
 @functools.lru_cache(maxsize=16)
 def _get_replacement_pattern(replacement: str) -> re.Pattern:
@@ -88,7 +101,10 @@ def sanitize_filename(filename: str, replacement: str = "_") -> str:
     # 3. Replace dangerous characters
     # ? Keep only alphanumeric, ., -, _ using negated character class
     # ? The + in the regex collapses multiple invalid chars into one replacement
-    filename = _INVALID_CHARS_PATTERN.sub(replacement, filename)
+    # ? Most real filenames are already clean: a search() that finds nothing
+    # ? is cheaper than a sub() that substitutes nothing.
+    if _INVALID_CHARS_PATTERN.search(filename) is not None:
+        filename = _INVALID_CHARS_PATTERN.sub(replacement, filename)
 
     # 4. Collapse multiple replacements
     if replacement:
@@ -129,30 +145,7 @@ def sanitize_filename(filename: str, replacement: str = "_") -> str:
     # ? Using `==` with `or` is measurably faster than `in {3, 4}` for simple
     # ? integer checks.
     root_len = len(root)
-    if (root_len == 3 or root_len == 4) and root.upper() in {
-        "CON",
-        "PRN",
-        "AUX",
-        "NUL",
-        "COM1",
-        "COM2",
-        "COM3",
-        "COM4",
-        "COM5",
-        "COM6",
-        "COM7",
-        "COM8",
-        "COM9",
-        "LPT1",
-        "LPT2",
-        "LPT3",
-        "LPT4",
-        "LPT5",
-        "LPT6",
-        "LPT7",
-        "LPT8",
-        "LPT9",
-    }:
+    if (root_len == 3 or root_len == 4) and root.upper() in _WINDOWS_RESERVED_NAMES:
         # Ensure we actually modify the filename even if replacement is empty
         prefix = replacement if replacement else "_"
         filename = prefix + filename
@@ -188,40 +181,31 @@ def safe_path_join(base_dir: str, *paths: str) -> str:
     # Use realpath to resolve symlinks, preventing symlink attacks
     base_path = os.path.realpath(base_dir)
 
+    # Prevent null byte injection
+    # ? One C-level scan over all components instead of one per component
+    if "\0" in "".join(paths):
+        raise ValueError("Null byte found in path component")
+
     # Join the paths
     # Note: os.path.join will discard previous components if a component is absolute.
-    # We must check for this.
-    final_path = base_path
-    for p in paths:
-        # Prevent null byte injection
-        if "\0" in p:
-            raise ValueError("Null byte found in path component")
-
-        # Determine if the component is absolute
-        # If it is, we treat it as relative to the base (stripping root)
-        # OR we just reject it. os.path.join behavior with absolute paths is
-        # often a source of bugs.
-        # Here we will reject it if it resets the root, OR we can strip the
-        # leading slash.
-        # Safest is to strip leading slashes/drive letters to force relative
-        # join.
-        if os.path.isabs(p):
-            # Handle Windows drive letters (e.g. C:\) by splitting drive
-            # splitdrive returns ('', p) on non-Windows usually, or
-            # ('C:', '\path') on Windows
-            drive, p = os.path.splitdrive(p)
-            # Strip leading separators to ensure it's relative
-            p = p.lstrip(os.path.sep)
-
-        final_path = os.path.join(final_path, p)
-
-    # Resolve the final path
-    resolved_path = os.path.realpath(final_path)
-
-    # Check if the resolved path starts with the base path
-    # We use commonprefix to ensure we don't match partial folder names
-    # e.g. /var/www matching /var/www-secret
-    if os.path.commonpath([base_path, resolved_path]) != base_path:
+    # ? os.path.join behavior with absolute paths is often a source of bugs, so
+    # ? absolute components are forced relative: split off any drive letter
+    # ? (e.g. C:\) and strip leading separators.
+    relative_paths = [
+        os.path.splitdrive(p)[1].lstrip(os.path.sep) if os.path.isabs(p) else p
+        for p in paths
+    ]
+
+    # Resolve the final path in a single realpath call
+    resolved_path = os.path.realpath(os.path.join(base_path, *relative_paths))
+
+    # Check if the resolved path is the base or lies below it
+    # ? Compare against base + separator so /var/www does not match
+    # ? /var/www-secret; a root base such as "/" already ends with one.
+    base_prefix = base_path
+    if not base_prefix.endswith(os.path.sep):
+        base_prefix += os.path.sep
+    if resolved_path != base_path and not resolved_path.startswith(base_prefix):
         raise ValueError("Path traversal detected: path is outside base directory")
 
     return resolved_path
@@ -1,6 +1,11 @@
 import unittest
 
-from gunz_utils.enums import BaseIntEnum, BaseStrEnum, OptionalBaseStrEnum
+from gunz_utils.enums import (
+    BaseIntEnum,
+    BaseStrEnum,
+    FuzzyLookupError,
+    OptionalBaseStrEnum,
+)
 
 
 class TestBaseStrEnum(unittest.TestCase):
@@ -42,6 +47,21 @@ class TestBaseStrEnum(unittest.TestCase):
             self.EnumClass.from_fuzzy_string("crimson"), self.EnumClass.RED
         )
 
+    def test_from_fuzzy_string_alias_keys_case_insensitive(self):
+        class Shade(BaseStrEnum):
+            __ALIASES__ = {"Dark": "dark_blue"}
+            DARK_BLUE = "dark_blue"
+
+        self.assertIs(Shade.from_fuzzy_string("dark"), Shade.DARK_BLUE)
+        self.assertIs(Shade.from_fuzzy_string("DARK"), Shade.DARK_BLUE)
+
+    def test_invalid_alias_target_fails_at_class_creation(self):
+        with self.assertRaisesRegex(ValueError, "Alias target 'purple'"):
+
+            class BadColor(BaseStrEnum):
+                __ALIASES__ = {"violet": "purple"}
+                RED = "red"
+
     def test_introspection(self):
         self.assertEqual(
             self.EnumClass.names(), ["RED", "BLUE", "DARK_BLUE", "LIGHT_GREEN"]
@@ -62,6 +82,20 @@ class TestBaseStrEnum(unittest.TestCase):
             self.EnumClass.choices(), ["red", "blue", "dark_blue", "light green"]
         )
 
+    def test_lookups_do_not_write_class_attributes(self):
+        before = dict(self.EnumClass.__dict__)
+        self.EnumClass.from_fuzzy_string("Light-Green")
+        self.EnumClass.get_or_none("purple")
+        self.EnumClass.names()
+        self.assertEqual(dict(self.EnumClass.__dict__), before)
+
+    def test_introspection_returns_fresh_lists(self):
+        names = self.EnumClass.names()
+        names.append("PURPLE")
+        self.assertEqual(
+            self.EnumClass.names(), ["RED", "BLUE", "DARK_BLUE", "LIGHT_GREEN"]
+        )
+
     def test_get_or_none_exact_match(self):
         self.assertEqual(self.EnumClass.get_or_none("red"), self.EnumClass.RED)
 
@@ -76,6 +110,30 @@ class TestBaseStrEnum(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.EnumClass.from_fuzzy_string("purple")
 
+    def test_from_fuzzy_string_invalid_lookup_message(self):
+        with self.assertRaises(FuzzyLookupError) as cm:
+            self.EnumClass.from_fuzzy_string("purple")
+        self.assertEqual(
+            str(cm.exception),
+            "'purple' is not a valid Color. Please use one of: "
+            "'red', 'blue', 'dark_blue', 'light green'",
+        )
+        self.assertIs(cm.exception.enum_cls, self.EnumClass)
+        self.assertEqual(cm.exception.value_str, "purple")
+
+    def test_lookup_error_keeps_state_in_slots(self):
+        with self.assertRaises(FuzzyLookupError) as cm:
+            self.EnumClass.from_fuzzy_string("purple")
+        exc = cm.exception
+        self.assertTrue(not hasattr(exc, "__dict__") or exc.__dict__ == {})
+
+    def test_fuzzy_map_built_at_class_creation(self):
+        # The map exists before any lookup and cannot be mutated.
+        fuzzy_map = self.EnumClass.__dict__["_lookup_map"]
+        self.assertIs(fuzzy_map["light_green"], self.EnumClass.LIGHT_GREEN)
+        with self.assertRaises(TypeError):
+            fuzzy_map["purple"] = self.EnumClass.RED
+
 
 class TestOptionalBaseStrEnum(unittest.TestCase):
     def test_none_handling_get_or_none(self):
@@ -95,6 +153,18 @@ class TestOptionalBaseStrEnum(unittest.TestCase):
 
         self.assertEqual(Status(None), Status.NONE)
 
+    def test_fuzzy_constructor_memoized(self):
+        class Status(OptionalBaseStrEnum):
+            NONE = "none"
+            ACTIVE = "active"
+
+        self.assertIs(Status("Active"), Status.ACTIVE)
+        self.assertIs(Status("Active"), Status.ACTIVE)
+        with self.assertRaises(ValueError):
+            Status("inactive")
+        info = Status._cached_from_fuzzy.cache_info()
+        self.assertEqual((info.hits, info.currsize), (1, 1))
+
     def test_missing_none_member(self):
         with self.assertRaises(TypeError):
 
@@ -122,6 +192,13 @@ class TestBaseIntEnum(unittest.TestCase):
         )
         self.assertEqual(self.EnumClass.from_fuzzy_int_string("ok"), self.EnumClass.OK)
 
+    def test_invalid_alias_target_fails_at_class_creation(self):
+        with self.assertRaisesRegex(ValueError, "Alias target '500'"):
+
+            class BadCode(BaseIntEnum):
+                __ALIASES__ = {"error": 500}
+                OK = 200
+
     def test_from_fuzzy_int_string_name_match(self):
         self.assertEqual(
             self.EnumClass.from_fuzzy_int_string("NOT_FOUND"), self.EnumClass.NOT_FOUND
@@ -54,6 +54,25 @@ class TestEnumSecurity(unittest.TestCase):
             TestInt.from_fuzzy_int_string(long_str_bad)
         self.assertIn("Input string too long", str(cm.exception))
 
+    def test_huge_input_rejected_before_processing(self):
+        """Test that megabyte-sized inputs are rejected by the length guard."""
+
+        class TestStr(BaseStrEnum):
+            A = "a"
+
+        class TestInt(BaseIntEnum):
+            ONE = 1
+
+        huge = "A-" * 500_000
+
+        with self.assertRaisesRegex(ValueError, "Input string too long"):
+            TestStr.from_fuzzy_string(huge)
+        with self.assertRaisesRegex(ValueError, "Input string too long"):
+            TestInt.from_fuzzy_int_string(huge)
+
+        self.assertIsNone(TestStr.get_or_none(huge))
+        self.assertIsNone(TestInt.get_or_none(huge))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -125,6 +125,17 @@ class TestSecurity(unittest.TestCase):
                 # properly for the OS if needed, but ".." is standard.
                 safe_path_join(base, "uploads/../../etc/passwd")
 
+    def test_safe_path_join_sibling_prefix(self):
+        """Test that a sibling sharing the base name as prefix is rejected."""
+        with tempfile.TemporaryDirectory() as tmp_path:
+            base = os.path.realpath(str(tmp_path))
+            sibling = "../" + os.path.basename(base) + "-secret/file.txt"
+
+            with self.assertRaisesRegex(ValueError, "Path traversal detected"):
+                safe_path_join(base, sibling)
+
+            self.assertEqual(safe_path_join(base, "uploads", ".."), base)
+
     def test_safe_path_join_absolute_input(self):
         """Test handling of absolute inputs (should be treated as relative)."""
         with tempfile.TemporaryDirectory() as tmp_path:
@@ -1,4 +1,17 @@
+import functools
+import inspect
+import threading
+import typing as t
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from pydantic import (
+    AfterValidator,
+    Field,
+    PydanticSchemaGenerationError,
+    validate_call,
+)
 
 from gunz_utils import type_checked
 
@@ -71,6 +84,16 @@ class TestTypeChecked(unittest.TestCase):
         self.assertIn("Input should be a valid integer", msg)
         self.assertIn("got type 'str'", msg)
 
+    def test_nested_error_location(self):
+        @type_checked
+        def total(values: list[int]) -> int:
+            return sum(values)
+
+        with self.assertRaises(TypeError) as cm:
+            total(values=[1, "x"])
+
+        self.assertIn("Argument 'values -> 1'", str(cm.exception))
+
     def test_varargs(self):
         @type_checked
         def varargs_func(*args: int) -> int:
@@ -91,6 +114,188 @@ class TestTypeChecked(unittest.TestCase):
         with self.assertRaises(TypeError):
             kwargs_func(a=1, b="y")
 
+    def test_simple_signature_keeps_pydantic_coercion(self):
+        @type_checked
+        def add(a: int, b: int | None) -> int:
+            return a + (b or 0)
+
+        self.assertEqual(add(1, 2), 3)
+        self.assertEqual(add(1, None), 1)
+        # Inputs that are not an exact type match still go through pydantic
+        self.assertEqual(add("1", 2), 3)
+        with self.assertRaises(TypeError) as cm:
+            add(1, "two")
+        self.assertIn("got type 'str'", str(cm.exception))
+
+    def test_annotated_constraints_are_enforced(self):
+        @type_checked
+        def positive(x: t.Annotated[int, Field(gt=0)]) -> int:
+            return x
+
+        @type_checked
+        def shout(s: t.Annotated[str, AfterValidator(str.upper)]) -> str:
+            return s
+
+        @type_checked
+        def maybe(x: t.Annotated[int, Field(gt=0)] | None) -> int | None:
+            return x
+
+        self.assertEqual(positive(1), 1)
+        with self.assertRaises(TypeError) as cm:
+            positive(-1)
+        self.assertIn("greater than 0", str(cm.exception))
+        self.assertEqual(shout("abc"), "ABC")
+        with self.assertRaises(TypeError):
+            maybe(-1)
+
+    def test_field_default_constraints_are_enforced(self):
+        @type_checked
+        def g(x: int = Field(default=1, gt=0)) -> int:
+            return x
+
+        with self.assertRaises(TypeError):
+            g(-5)
+
+    def test_constrained_keyword_and_default_calls_use_pydantic(self):
+        @type_checked
+        def g(x: int = Field(default=1, gt=0)) -> int:
+            return x
+
+        @type_checked
+        def k(x: t.Annotated[int, Field(gt=0)], y: int) -> int:
+            return x + y
+
+        # The omitted default is resolved by pydantic, not passed as FieldInfo
+        self.assertEqual(g(), 1)
+        self.assertEqual(g(x=2), 2)
+        with self.assertRaises(TypeError):
+            g(x=-5)
+        self.assertEqual(k(x=1, y=2), 3)
+        with self.assertRaises(TypeError):
+            k(x=-1, y=2)
+
+    def test_simple_signature_preserves_metadata(self):
+        @type_checked
+        def scale(x: float) -> float:
+            """Scale x."""
+            return x * 2
+
+        self.assertEqual(scale.__name__, "scale")
+        self.assertEqual(scale.__doc__, "Scale x.")
+        self.assertEqual(list(inspect.signature(scale).parameters), ["x"])
+        self.assertEqual(scale(1.5), 3.0)
+
+    def test_simple_signature_keyword_and_default_calls(self):
+        with mock.patch("pydantic.validate_call", wraps=validate_call) as spy:
+
+            @type_checked
+            def label(name: str, count: int = 1, *, sep: str = ":") -> str:
+                return f"{name}{sep}{count}"
+
+            self.assertEqual(label("a"), "a:1")
+            self.assertEqual(label(name="a", count=2), "a:2")
+            self.assertEqual(label("a", sep="-"), "a-1")
+            spy.assert_not_called()
+
+            # Coercion, missing and unknown arguments are left to pydantic
+            self.assertEqual(label("a", count="3"), "a:3")
+            with self.assertRaises(TypeError):
+                label(count=2)
+            with self.assertRaises(TypeError):
+                label("a", colour="red")
+            with self.assertRaises(TypeError):
+                label("a", name="b")
+            spy.assert_called_once()
+
+    def test_partial_and_function_attributes(self):
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        add.tag = "math"
+
+        checked = type_checked(add)
+        self.assertEqual(checked.tag, "math")
+
+        add_one = type_checked(functools.partial(add, 1))
+        self.assertEqual(add_one(2), 3)
+
+    def test_validation_error_keeps_state_in_slots(self):
+        @type_checked
+        def total(values: list[int]) -> int:
+            return sum(values)
+
+        with self.assertRaises(TypeError) as cm:
+            total(["x"])
+        exc = cm.exception
+        str(exc)  # render and cache the message
+        self.assertTrue(not hasattr(exc, "__dict__") or exc.__dict__ == {})
+
+    def test_factory_form_passes_config(self):
+        strict = type_checked(config={"strict": True})
+
+        @strict
+        def double(x: int) -> int:
+            return x * 2
+
+        self.assertEqual(double(2), 4)
+        with self.assertRaises(TypeError):
+            double("2")
+
+    def test_documented_validate_call_import(self):
+        from gunz_utils.ext.validation_pydantic import validate_call as exported
+
+        self.assertIs(exported, validate_call)
+
+    def test_schema_errors_surface_at_call_time(self):
+        class Foo:
+            pass
+
+        # Decoration succeeds; the unsupported annotation fails on each call
+        @type_checked
+        def f(x: Foo) -> Foo:
+            return x
+
+        for _ in range(2):
+            with self.assertRaises(PydanticSchemaGenerationError):
+                f(Foo())
+
+    def test_validator_built_on_first_call(self):
+        with mock.patch(
+            "pydantic.validate_call",
+            wraps=validate_call,
+        ) as spy:
+
+            @type_checked
+            def total(values: list[int]) -> int:
+                return sum(values)
+
+            spy.assert_not_called()
+            self.assertEqual(total([1, 2]), 3)
+            self.assertEqual(total(["3"]), 3)
+            spy.assert_called_once()
+
+    def test_validator_built_once_under_concurrent_first_calls(self):
+        with mock.patch(
+            "pydantic.validate_call",
+            wraps=validate_call,
+        ) as spy:
+
+            @type_checked
+            def total(values: list[int]) -> int:
+                return sum(values)
+
+            barrier = threading.Barrier(8)
+
+            def call() -> int:
+                barrier.wait()
+                return total([1, 2])
+
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(lambda _: call(), range(8)))
+
+            self.assertEqual(results, [3] * 8)
+            spy.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,15 @@
+import pickle
 import unittest
 
+from pydantic import BaseModel, Field
+
 from gunz_utils import type_checked
 
 
+class _User(BaseModel):
+    password: str = Field(min_length=50)
+
+
 class TestValidationLeak(unittest.TestCase):
     def test_sensitive_data_leakage(self):
         """
@@ -34,6 +41,47 @@ class TestValidationLeak(unittest.TestCase):
         # Ensure we still get useful info (like the type)
         self.assertIn("got type 'str'", error_msg)
 
+    def test_sensitive_data_not_in_repr_or_pickle(self):
+        @type_checked
+        def login(username: str, age: int):
+            pass
+
+        sensitive_password = "MySecretPassword123!"
+
+        with self.assertRaises(TypeError) as cm:
+            login("user", age=sensitive_password)  # type: ignore
+
+        self.assertNotIn(sensitive_password, repr(cm.exception))
+        self.assertEqual(
+            repr(cm.exception), f"ValidationTypeError({str(cm.exception)!r})"
+        )
+        restored = pickle.loads(pickle.dumps(cm.exception))
+        self.assertIsInstance(restored, TypeError)
+        self.assertEqual(str(restored), str(cm.exception))
+        self.assertNotIn(sensitive_password, str(restored))
+
+    def test_validation_error_from_function_body_is_sanitized(self):
+        @type_checked
+        def create_user(name: str, password: str) -> _User:
+            return _User(password=password)
+
+        sensitive_password = "MySecretPassword123!"
+
+        # Exact-type positional call, i.e. the generated fast path
+        with self.assertRaises(TypeError) as cm:
+            create_user("bob", sensitive_password)
+
+        self.assertNotIn(sensitive_password, str(cm.exception))
+        self.assertNotIn(sensitive_password, repr(cm.exception))
+        self.assertIn("got type 'str'", str(cm.exception))
+
+        # Keyword call, i.e. the generated bind-and-check branch
+        with self.assertRaises(TypeError) as cm:
+            create_user(name="bob", password=sensitive_password)
+
+        self.assertNotIn(sensitive_password, str(cm.exception))
+        self.assertNotIn(sensitive_password, repr(cm.exception))
+
 
 if __name__ == "__main__":
     unittest.main()